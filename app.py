@@ -1,25 +1,19 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import time
+import copy
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
-import folium
 from streamlit_folium import st_folium
-import base64
 
 # Import custom modules
 from data_generator import generate_parking_data
-from prediction_model import train_prediction_model, predict_parking_availability
-from visualization import plot_occupancy_trend, plot_hourly_average, create_parking_map
+from prediction_model import train_prediction_model, predict_parking_availability, predict_parking_availability_batch
+from visualization import plot_occupancy_trend, plot_hourly_average, build_base_map, add_occupancy_markers
 from utils import load_svg, calculate_statistics
 import database as db
 
-# Initialize database
-db.init_db()
-db.seed_database()
-
 # Set page configuration
 st.set_page_config(
     page_title="USF Parking System",
@@ -28,6 +22,15 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# Initialize database once per server process instead of on every rerun
+@st.cache_resource(show_spinner=False)
+def _bootstrap_db():
+    db.init_db()
+    db.seed_database()
+    return True
+
+_bootstrap_db()
+
 # Create a sidebar
 st.sidebar.title("USF Parking System")
 # Display USF colors
@@ -49,7 +52,12 @@ st.sidebar.markdown("""
     }
 </style>
 """, unsafe_allow_html=True)
-parking_icon = load_svg("assets/parking_icon.svg")
+@st.cache_data(show_spinner=False)
+def cached_svg(svg_file):
+    """Read the sidebar icon once instead of hitting disk on every rerun."""
+    return load_svg(svg_file)
+
+parking_icon = cached_svg("assets/parking_icon.svg")
 st.sidebar.markdown(parking_icon, unsafe_allow_html=True)
 st.sidebar.markdown("---")
 st.sidebar.markdown("**University of South Florida**")
@@ -61,156 +69,522 @@ page = st.sidebar.radio(
     ["Dashboard", "Prediction", "Historical Data", "Management", "Student Resources", "About"],
 )
 
+# Tight dtypes for the in-memory history: counts fit int16, calendar fields
+# int8 and percentages float32, halving memory versus pandas defaults
+_HISTORY_DTYPES = {
+    'occupancy': 'int16',
+    'total_spaces': 'int16',
+    'day_of_week': 'int8',
+    'hour': 'int8',
+    'minute': 'int8',
+    'occupancy_pct': 'float32',
+}
+
+def prepare_history(historical_data):
+    """Attach derived columns and downcast dtypes once at ingest instead of per render."""
+    if len(historical_data) > 0:
+        if 'occupancy_pct' not in historical_data.columns:
+            historical_data['occupancy_pct'] = (
+                historical_data['occupancy'] / historical_data['total_spaces'] * 100
+            )
+        historical_data = historical_data.astype({
+            col: dtype for col, dtype in _HISTORY_DTYPES.items()
+            if col in historical_data.columns
+        })
+    return historical_data
+
+# Cached data access helpers
+@st.cache_data(ttl=900, show_spinner=False)
+def load_historical_data(days=7):
+    """Load historical occupancy data once and share it across reruns/sessions."""
+    return prepare_history(db.get_historical_data(days=days))
+
+# TTL matches the fastest selectable refresh cadence on the Dashboard; a
+# longer TTL would serve stale cached snapshots to sessions polling at 15s
+@st.cache_data(ttl=15, show_spinner=False)
+def load_current_occupancy():
+    """Fetch the live occupancy snapshot, shared across reruns for up to 15s."""
+    return db.get_current_occupancy()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_parking_lots():
+    """Fetch parking lots; they change only through the Management forms."""
+    return db.get_parking_lots()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_parking_areas(lot_id):
+    """Fetch the areas of a lot; they change only through the Management forms."""
+    return db.get_parking_areas(lot_id)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_areas_grouped():
+    """Fetch all areas in one query, grouped by lot id."""
+    return db.get_all_areas_grouped()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_database_stats():
+    """Fetch the database statistics shown on the Management page."""
+    return db.get_database_stats()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def lot_name_to_id():
+    """Cached name -> id mapping backing the lot selectbox."""
+    return {lot.name: lot.id for lot in load_parking_lots()}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def lots_dataframe():
+    """Typed DataFrame backing the Existing Parking Lots table.
+
+    Building it once with explicit dtypes spares Streamlit the per-rerun
+    list-of-dicts to Arrow conversion.
+    """
+    lots = load_parking_lots()
+    return pd.DataFrame({
+        'ID': pd.array([lot.id for lot in lots], dtype='int32'),
+        'Name': pd.array([lot.name for lot in lots], dtype='string'),
+        'Total Spaces': pd.array([lot.total_spaces for lot in lots], dtype='int32'),
+        'Location': pd.array(
+            [f"({lot.latitude}, {lot.longitude})" for lot in lots], dtype='string'
+        )
+    })
+
+def history_fingerprint(historical_data):
+    """Cheap cache key for the historical data (row count + latest timestamp)."""
+    if len(historical_data) == 0:
+        return (0, None)
+    return (len(historical_data), historical_data['timestamp'].iloc[-1])
+
+@st.cache_resource(show_spinner=False)
+def get_trained_model(data_fingerprint):
+    """Train the prediction model, re-fitting only when the data fingerprint changes."""
+    return train_prediction_model(st.session_state.historical_data)
+
+@st.cache_data(show_spinner=False)
+def predict_hour(model_fingerprint, _model, weekday, hour):
+    """Memoized single-hour prediction; only 7x24 distinct keys per model.
+
+    Keyed on the training fingerprint (not a per-session counter) so sessions
+    whose models were fit on different history never share cached entries.
+    """
+    return predict_parking_availability(_model, weekday, hour, 0)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_daily_stats(start_date, end_date):
+    """Fetch per-day occupancy statistics aggregated in the database."""
+    return db.get_daily_stats(start_date, end_date)
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda d: (len(d), d['timestamp'].iloc[-1] if len(d) else None)}
+)
+def compute_dow_hour_pivot(filtered_data, start_date, end_date):
+    """Aggregate the (hour, day_of_week) -> occupancy % matrix once per data change."""
+    # One vectorized accumulation pass into fixed (24, 7) buckets instead of
+    # a groupby plus unstack over the filtered frame
+    hour_arr = filtered_data['hour'].to_numpy()
+    dow_arr = filtered_data['day_of_week'].to_numpy()
+    pct = filtered_data['occupancy_pct'].to_numpy(dtype=np.float64)
+
+    sums = np.zeros((24, 7))
+    counts = np.zeros((24, 7))
+    np.add.at(sums, (hour_arr, dow_arr), pct)
+    np.add.at(counts, (hour_arr, dow_arr), 1)
+
+    with np.errstate(invalid='ignore'):
+        means = sums / counts
+
+    # Keep only observed hours/days, matching the old groupby/unstack shape
+    pivot = pd.DataFrame(means, index=np.arange(24), columns=np.arange(7))
+    return pivot.loc[counts.sum(axis=1) > 0, counts.sum(axis=0) > 0]
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda d: (len(d), d['timestamp'].iloc[-1] if len(d) else None)}
+)
+def build_heatmap_figure(filtered_data, start_date, end_date):
+    """Build the day-of-week/hour occupancy heatmap with a frozen layout."""
+    pivot_data = compute_dow_hour_pivot(filtered_data, start_date, end_date)
+
+    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    fig = px.imshow(
+        pivot_data,
+        labels=dict(x="Day of Week", y="Hour of Day", color="Occupancy %"),
+        x=[days[i] for i in pivot_data.columns],
+        y=pivot_data.index,
+        aspect="auto",
+        color_continuous_scale="RdYlGn_r"
+    )
+
+    # Pin the template explicitly so Plotly skips template auto-resolution
+    fig.layout.template = 'plotly'
+    fig.update_layout(
+        title='Occupancy Heatmap by Day and Hour',
+        xaxis_title='Day of Week',
+        yaxis_title='Hour of Day',
+        coloraxis_colorbar=dict(title='Occupancy %')
+    )
+
+    return fig
+
+@st.cache_data(show_spinner=False)
+def cached_occupancy_trend(nrows, last_ts, _historical_data):
+    """Build the occupancy trend figure, reused until the data fingerprint changes."""
+    return plot_occupancy_trend(_historical_data)
+
+@st.cache_data(show_spinner=False)
+def cached_hourly_average(nrows, last_ts, _historical_data):
+    """Build the hourly average figure, reused until the data fingerprint changes."""
+    return plot_hourly_average(_historical_data)
+
+@st.cache_data(show_spinner=False)
+def cached_statistics(nrows, last_ts, today, _historical_data):
+    """Compute dashboard statistics only when the history or the calendar day changes.
+
+    The full history is kept as input (rather than just today's slice) because
+    the weekly averages feed the metric deltas.
+    """
+    return calculate_statistics(_historical_data)
+
+@st.cache_resource(show_spinner=False)
+def cached_base_map():
+    """Build the static Folium base map (tiles, garages, legend) once per process."""
+    return build_base_map()
+
+# Only the latest signature is ever re-hit (occupancy changes each tick), so a
+# tiny bound is enough; without it every tick would pin another deep-copied map
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _rendered_map(occupancy_signature, _occupancy_data):
+    """Overlay occupancy markers on a copy of the cached base map."""
+    m = copy.deepcopy(cached_base_map())
+    return add_occupancy_markers(m, _occupancy_data)
+
+def render_parking_map(occupancy_data):
+    """Render the parking map, reusing it while the area counts are unchanged."""
+    # Most ticks leave the counts untouched, so key the cache on them and
+    # skip rebuilding (and re-serializing) the Folium map entirely
+    signature = tuple(sorted(
+        (name, area['occupied'], area['total'])
+        for name, area in occupancy_data['areas'].items()
+    ))
+    return _rendered_map(signature, occupancy_data)
+
 # Initialize session state for data persistence
 if 'historical_data' not in st.session_state:
     # Get historical data from database
-    st.session_state.historical_data = db.get_historical_data(days=7)
-    
+    st.session_state.historical_data = load_historical_data(days=7)
+
     # Train the prediction model with historical data
-    st.session_state.model = train_prediction_model(st.session_state.historical_data)
+    fingerprint = history_fingerprint(st.session_state.historical_data)
+    st.session_state.model = get_trained_model(fingerprint)
+    st.session_state.model_fingerprint = fingerprint
+    st.session_state.last_train = datetime.now()
+    st.session_state.last_trained_len = len(st.session_state.historical_data)
 
 if 'last_update' not in st.session_state:
     st.session_state.last_update = datetime.now()
-    
+
+if 'pending_rows' not in st.session_state:
+    # Rows appended since the last time historical_data was materialized
+    st.session_state.pending_rows = []
+
+
 if 'real_time_data' not in st.session_state:
     # Initialize real-time data from database
-    st.session_state.real_time_data = db.get_current_occupancy()
+    st.session_state.real_time_data = load_current_occupancy()
+
+# Fold pending rows into the historical DataFrame in one concat
+def flush_pending_rows(min_rows=96):
+    pending = st.session_state.pending_rows
+    # Nothing pending (the common path on most reruns): skip the concat entirely
+    if not pending or len(pending) < min_rows:
+        return
+
+    # Mirror the history dtypes so concat doesn't upcast everything to int64
+    new_df = pd.DataFrame(pending)
+    new_df = new_df.astype({
+        col: dtype for col, dtype in _HISTORY_DTYPES.items()
+        if col in new_df.columns
+    })
+    st.session_state.historical_data = pd.concat(
+        [st.session_state.historical_data, new_df],
+        ignore_index=True
+    )
+    pending.clear()
 
 # Function to update real-time data
 def update_data():
     current_time = datetime.now()
     
     # Update real-time data from database
-    st.session_state.real_time_data = db.get_current_occupancy()
+    st.session_state.real_time_data = load_current_occupancy()
     
     # Add new data to historical dataset every 15 minutes
     time_diff = current_time - st.session_state.last_update
     if time_diff.total_seconds() >= 900:  # 15 minutes in seconds
-        # Get the most recent data from the database
-        st.session_state.historical_data = db.get_historical_data(days=7)
         st.session_state.last_update = current_time
-        
+
         # Get main parking lot
-        lots = db.get_parking_lots()
+        lots = load_parking_lots()
         if lots:
             main_lot = lots[0]
-            
-            # Add a new occupancy record to the database
-            db.add_occupancy_record(
-                lot_id=main_lot.id,
-                occupied_spaces=st.session_state.real_time_data['total_occupied'],
-                timestamp=current_time
-            )
-            
+
+            # Collect the tick's records and insert them in one round-trip
+            db_records = [{
+                'lot_id': main_lot.id,
+                'occupied_spaces': st.session_state.real_time_data['total_occupied'],
+                'timestamp': current_time
+            }]
+            st.session_state.pending_rows.append({
+                'timestamp': current_time,
+                'occupancy': st.session_state.real_time_data['total_occupied'],
+                'total_spaces': main_lot.total_spaces,
+                'day_of_week': current_time.weekday(),
+                'hour': current_time.hour,
+                'minute': current_time.minute,
+                'lot_id': main_lot.id,
+                'area_id': None,
+                'occupancy_pct': st.session_state.real_time_data['total_occupied'] / main_lot.total_spaces * 100
+            })
+
             # Add records for each area
-            areas = db.get_parking_areas(main_lot.id)
+            areas = load_parking_areas(main_lot.id)
             for area in areas:
                 area_data = st.session_state.real_time_data['areas'].get(area.name)
                 if area_data:
-                    db.add_occupancy_record(
-                        lot_id=main_lot.id,
-                        area_id=area.id,
-                        occupied_spaces=area_data['occupied'],
-                        timestamp=current_time
-                    )
-        
-        # Retrain model with updated data
-        st.session_state.model = train_prediction_model(st.session_state.historical_data)
+                    db_records.append({
+                        'lot_id': main_lot.id,
+                        'area_id': area.id,
+                        'occupied_spaces': area_data['occupied'],
+                        'timestamp': current_time
+                    })
+                    st.session_state.pending_rows.append({
+                        'timestamp': current_time,
+                        'occupancy': area_data['occupied'],
+                        'total_spaces': main_lot.total_spaces,
+                        'day_of_week': current_time.weekday(),
+                        'hour': current_time.hour,
+                        'minute': current_time.minute,
+                        'lot_id': main_lot.id,
+                        'area_id': area.id,
+                        'occupancy_pct': area_data['occupied'] / main_lot.total_spaces * 100
+                    })
+
+            db.add_occupancy_records_bulk(db_records)
+
+            # New records landed: drop the shared historical cache so the next
+            # cold session sees them instead of waiting out the TTL
+            load_historical_data.clear()
+
+        # Materialize pending rows into the historical DataFrame in batches
+        # so each append doesn't copy the full accumulated history
+        flush_pending_rows()
+
+        # Retrain at most every 6 hours, and only once enough new rows have
+        # accumulated to actually move the model (a handful of 15-minute
+        # samples is statistical noise against a week of history)
+        new_rows = len(st.session_state.historical_data) - st.session_state.last_trained_len
+        if (current_time - st.session_state.last_train).total_seconds() >= 6 * 3600 and new_rows >= 48:
+            fingerprint = history_fingerprint(st.session_state.historical_data)
+            st.session_state.model = get_trained_model(fingerprint)
+            # The new fingerprint also keys predict_hour past its stale entries
+            st.session_state.model_fingerprint = fingerprint
+            st.session_state.last_train = current_time
+            st.session_state.last_trained_len = len(st.session_state.historical_data)
+
+# Static Markdown for the About page, built once at import instead of
+# re-evaluating multi-KB literals inside the page branch on every rerun
+_ABOUT_LOGO_HTML = """
+<div style="text-align: center; margin-bottom: 20px;">
+    <img src="https://www.usf.edu/identity/images/logos-and-brand-assets/usf-logo-color-rgb.png" width="400">
+</div>
+"""
+
+_ABOUT_MD = """
+## Overview
+
+The USF Parking System is an AI-powered application that provides real-time monitoring and prediction of parking availability across the University of South Florida's Tampa campus. The system aims to help students, faculty, staff, and visitors find parking more efficiently, reduce congestion, and improve the overall parking experience at USF.
+
+### Key Features
+
+- **Real-time Monitoring**: Track current parking occupancy across different areas
+- **Interactive Visualization**: Visual representation of parking spaces with status indicators
+- **Predictive Analytics**: Machine learning algorithms to forecast future parking availability
+- **Historical Analysis**: Explore past usage patterns to identify trends and peak periods
+
+### Technology Stack
+
+- **Frontend**: Streamlit for interactive web interface
+- **Database**: PostgreSQL for data storage and retrieval
+- **Data Processing**: Pandas and NumPy for data manipulation
+- **ORM**: SQLAlchemy for database interactions
+- **Machine Learning**: Scikit-learn for predictive models
+- **Visualization**: Plotly and Folium for interactive charts and maps
+
+### Data Sources
+
+In a production environment, this system would integrate with:
+
+- Smart parking sensors
+- Camera-based occupancy detection
+- Ticket systems and parking gates
+- Weather APIs and event calendars for improved predictions
+
+For this demonstration, we use a PostgreSQL database with simulated data that mimics real-world parking patterns.
+
+### Future Enhancements
+
+- Integration with mobile apps for navigation
+- Advanced prediction models incorporating weather and events
+- Reservation systems and payment integration
+- Multi-site parking management
+"""
+
+_HOW_IT_WORKS_MD = """
+## How It Works
+
+### Data Collection
+
+The system continuously collects occupancy data from parking sensors or cameras. This data is processed and stored to provide real-time updates and historical analysis.
+
+### Prediction Algorithm
+
+Our machine learning model analyzes historical patterns to predict future parking availability. The model considers:
+
+- Day of the week
+- Time of day
+- Historical occupancy patterns
+- Recent trends
+
+### Visualization Engine
+
+The dashboard displays real-time and historical data through interactive charts and maps. Users can:
+
+- View current availability by parking area
+- Analyze historical trends and patterns
+- Predict future availability for planning
+"""
 
 # Dashboard Page
 if page == "Dashboard":
     st.title("USF Parking Availability Dashboard")
     st.markdown("Real-time monitoring and visualization of USF Tampa campus parking garages")
-    
-    # Update data
-    update_data()
-    
-    # Create metrics row
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        available = st.session_state.real_time_data['total_spaces'] - st.session_state.real_time_data['total_occupied']
-        occupancy_pct = (st.session_state.real_time_data['total_occupied'] / st.session_state.real_time_data['total_spaces']) * 100
-        st.metric(
-            label="Available Spaces", 
-            value=f"{available}/{st.session_state.real_time_data['total_spaces']}",
-            delta="-" if occupancy_pct > 75 else "+"
-        )
-    
-    with col2:
-        st.metric(
-            label="Occupancy Rate", 
-            value=f"{occupancy_pct:.1f}%",
-            delta=f"{occupancy_pct - 70:.1f}%" if occupancy_pct > 70 else f"{70 - occupancy_pct:.1f}%"
-        )
-    
-    with col3:
-        # Get prediction for next hour
-        next_hour = datetime.now() + timedelta(hours=1)
-        predicted_occupancy = predict_parking_availability(
-            st.session_state.model, 
-            next_hour.weekday(),
-            next_hour.hour,
-            0  # minute = 0 for the start of the hour
-        )
-        predicted_pct = (predicted_occupancy / st.session_state.real_time_data['total_spaces']) * 100
-        st.metric(
-            label="Predicted (Next Hour)", 
-            value=f"{predicted_pct:.1f}%",
-            delta=f"{predicted_pct - occupancy_pct:.1f}%"
-        )
-    
-    with col4:
-        stats = calculate_statistics(st.session_state.historical_data)
-        st.metric(
-            label="Peak Occupancy Today", 
-            value=f"{stats['peak_today_pct']:.1f}%",
-            delta=f"{stats['peak_today_pct'] - stats['avg_pct']:.1f}%"
+
+    # User-configurable refresh cadence; viewers who don't need live updates
+    # can back off and cut their database polling accordingly
+    poll_interval = st.sidebar.select_slider(
+        "Refresh interval (seconds)",
+        options=[15, 30, 60, 300],
+        value=60
+    )
+
+    # Live sections (metrics, map, status and trend), refreshed on the chosen
+    # cadence without rerunning the whole script
+    @st.fragment(run_every=poll_interval)
+    def live_dashboard():
+        # Update data
+        update_data()
+
+        # Derive the shared real-time summary once; every widget below reads
+        # from these locals instead of re-indexing session state
+        rt = st.session_state.real_time_data
+        total = rt['total_spaces']
+        occupied = rt['total_occupied']
+        available = total - occupied
+        occupancy_pct = rt['occupancy_pct']
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric(
+                label="Available Spaces",
+                value=f"{available}/{total}",
+                delta="-" if occupancy_pct > 75 else "+"
+            )
+
+        with col2:
+            st.metric(
+                label="Occupancy Rate",
+                value=f"{occupancy_pct:.1f}%",
+                delta=f"{occupancy_pct - 70:.1f}%" if occupancy_pct > 70 else f"{70 - occupancy_pct:.1f}%"
+            )
+
+        with col3:
+            # Get prediction for next hour
+            next_hour = datetime.now() + timedelta(hours=1)
+            predicted_occupancy = predict_hour(
+                st.session_state.model_fingerprint,
+                st.session_state.model,
+                next_hour.weekday(),
+                next_hour.hour
+            )
+            predicted_pct = (predicted_occupancy / total) * 100
+            st.metric(
+                label="Predicted (Next Hour)",
+                value=f"{predicted_pct:.1f}%",
+                delta=f"{predicted_pct - occupancy_pct:.1f}%"
+            )
+
+        with col4:
+            stats = cached_statistics(
+                *history_fingerprint(st.session_state.historical_data),
+                datetime.now().date(),
+                st.session_state.historical_data
+            )
+            st.metric(
+                label="Peak Occupancy Today",
+                value=f"{stats['peak_today_pct']:.1f}%",
+                delta=f"{stats['peak_today_pct'] - stats['avg_pct']:.1f}%"
+            )
+
+        st.markdown("---")
+
+        # Interactive map and current status
+        col1, col2 = st.columns([3, 2])
+
+        with col1:
+            st.subheader("Parking Map")
+            map_data = render_parking_map(rt)
+            st_folium(map_data, width=700, returned_objects=[])
+
+        with col2:
+            st.subheader("Current Status")
+
+            # Render all areas as one vectorized table instead of several
+            # Streamlit calls per area
+            areas_df = pd.DataFrame.from_dict(rt['areas'], orient='index')
+            # occupancy_pct is already computed by get_current_occupancy; band
+            # with the same >= 50 / >= 80 thresholds as the map markers so the
+            # table and map never disagree at the boundaries
+            pct = areas_df['occupancy_pct'].to_numpy()
+            band = (pct >= 50).astype(int) + (pct >= 80)
+            areas_df['status'] = np.array(
+                ['🟢 Low', '🟠 Moderate', '🔴 High'], dtype=object
+            )[band]
+
+            st.dataframe(
+                areas_df[['occupied', 'total', 'occupancy_pct', 'status']],
+                column_config={
+                    'occupied': st.column_config.NumberColumn('Occupied'),
+                    'total': st.column_config.NumberColumn('Total'),
+                    'occupancy_pct': st.column_config.ProgressColumn(
+                        'Occupancy', min_value=0, max_value=100, format='%.1f%%'
+                    ),
+                    'status': st.column_config.TextColumn('Status')
+                },
+                use_container_width=True
+            )
+
+        st.markdown("---")
+
+        # Occupancy trends
+        st.subheader("Today's Occupancy Trend")
+        fig = cached_occupancy_trend(
+            *history_fingerprint(st.session_state.historical_data),
+            st.session_state.historical_data
         )
-    
-    st.markdown("---")
-    
-    # Interactive map and current status
-    col1, col2 = st.columns([3, 2])
-    
-    with col1:
-        st.subheader("Parking Map")
-        map_data = create_parking_map(st.session_state.real_time_data)
-        st_folium(map_data, width=700, returned_objects=[])
-    
-    with col2:
-        st.subheader("Current Status")
-        
-        # Create a visual representation of parking areas
-        areas = st.session_state.real_time_data['areas']
-        for area_name, area_data in areas.items():
-            occupied = area_data['occupied']
-            total = area_data['total']
-            occupied_pct = (occupied / total) * 100
-            
-            st.markdown(f"**{area_name}** - {occupied}/{total} spaces occupied")
-            
-            # Create a progress bar for occupancy
-            st.progress(occupied_pct / 100)
-            
-            # Determine status text and color
-            if occupied_pct < 50:
-                st.markdown("🟢 **Low occupancy**")
-            elif occupied_pct < 80:
-                st.markdown("🟠 **Moderate occupancy**")
-            else:
-                st.markdown("🔴 **High occupancy**")
-    
-    st.markdown("---")
-    
-    # Occupancy trends
-    st.subheader("Today's Occupancy Trend")
-    fig = plot_occupancy_trend(st.session_state.historical_data)
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Auto-refresh the data every 60 seconds
-    time.sleep(60)
-    st.rerun()
+        st.plotly_chart(fig, use_container_width=True)
+
+    live_dashboard()
 
 # Prediction Page
 elif page == "Prediction":
@@ -244,12 +618,12 @@ elif page == "Prediction":
             if prediction_date > max_date:
                 st.error("Predictions are only available for the next 7 days")
             else:
-                # Get prediction
-                predicted_occupancy = predict_parking_availability(
-                    st.session_state.model, 
+                # Get prediction (memoized per trained model)
+                predicted_occupancy = predict_hour(
+                    st.session_state.model_fingerprint,
+                    st.session_state.model,
                     predicted_date.weekday(),
-                    predicted_date.hour,
-                    0  # minute = 0 for the start of the hour
+                    predicted_date.hour
                 )
                 
                 predicted_pct = (predicted_occupancy / st.session_state.real_time_data['total_spaces']) * 100
@@ -268,7 +642,10 @@ elif page == "Prediction":
     with col2:
         st.subheader("Weekly Prediction Pattern")
         # Create hourly average occupancy plot
-        fig = plot_hourly_average(st.session_state.historical_data)
+        fig = cached_hourly_average(
+            *history_fingerprint(st.session_state.historical_data),
+            st.session_state.historical_data
+        )
         st.plotly_chart(fig)
         
         st.markdown("""
@@ -284,37 +661,34 @@ elif page == "Prediction":
     
     st.subheader("Next 24 Hours Forecast")
     
-    # Generate 24-hour forecast
+    # Generate 24-hour forecast with a single batched prediction
     current_time = datetime.now()
     forecast_hours = 24
-    forecast_times = [current_time + timedelta(hours=i) for i in range(1, forecast_hours + 1)]
-    
-    forecast_data = []
-    for t in forecast_times:
-        pred = predict_parking_availability(
-            st.session_state.model, 
-            t.weekday(),
-            t.hour,
-            0  # minute = 0 for the start of the hour
-        )
-        forecast_data.append({
-            'time': t,
-            'predicted_occupancy': pred,
-            'occupancy_pct': (pred / st.session_state.real_time_data['total_spaces']) * 100
-        })
-    
-    forecast_df = pd.DataFrame(forecast_data)
-    
-    # Create a line chart for the forecast
-    fig = px.line(
-        forecast_df, 
-        x='time', 
-        y='occupancy_pct',
-        labels={'time': 'Time', 'occupancy_pct': 'Occupancy %'},
-        title='24-Hour Occupancy Forecast'
+    forecast_times = pd.date_range(
+        current_time + timedelta(hours=1),
+        periods=forecast_hours,
+        freq='h'
     )
-    
+
+    forecast_features = np.column_stack([
+        forecast_times.weekday,
+        forecast_times.hour,
+        np.zeros(forecast_hours, dtype=int)  # minute = 0 for the start of the hour
+    ])
+    forecast_preds = predict_parking_availability_batch(st.session_state.model, forecast_features)
+
+    forecast_pct = (forecast_preds / st.session_state.real_time_data['total_spaces']) * 100
+
+    # Build the trace directly from the arrays; px.line would wrap them in a
+    # DataFrame only to introspect column types again
+    fig = go.Figure(go.Scatter(
+        x=forecast_times,
+        y=forecast_pct,
+        mode='lines'
+    ))
+
     fig.update_layout(
+        title='24-Hour Occupancy Forecast',
         xaxis_title="Time",
         yaxis_title="Predicted Occupancy (%)",
         yaxis_range=[0, 100]
@@ -344,25 +718,19 @@ elif page == "Historical Data":
             datetime.now().date()
         )
     
-    # Filter data based on date range
-    mask = (st.session_state.historical_data['timestamp'].dt.date >= start_date) & \
-           (st.session_state.historical_data['timestamp'].dt.date <= end_date)
-    filtered_data = st.session_state.historical_data.loc[mask]
-    
+    # The history is kept sorted by timestamp, so two binary searches replace
+    # a full boolean scan over the frame
+    ts = st.session_state.historical_data['timestamp'].values
+    lo = np.searchsorted(ts, np.datetime64(start_date))
+    hi = np.searchsorted(ts, np.datetime64(end_date) + np.timedelta64(1, 'D'))
+    filtered_data = st.session_state.historical_data.iloc[lo:hi]
+
     if len(filtered_data) == 0:
         st.warning("No data available for the selected date range.")
     else:
-        # Calculate daily statistics
-        daily_stats = filtered_data.groupby(filtered_data['timestamp'].dt.date).agg({
-            'occupancy': ['mean', 'max', 'min'],
-            'total_spaces': 'first'
-        }).reset_index()
-        
-        daily_stats.columns = ['date', 'avg_occupancy', 'max_occupancy', 'min_occupancy', 'total_spaces']
-        daily_stats['avg_pct'] = (daily_stats['avg_occupancy'] / daily_stats['total_spaces']) * 100
-        daily_stats['max_pct'] = (daily_stats['max_occupancy'] / daily_stats['total_spaces']) * 100
-        daily_stats['min_pct'] = (daily_stats['min_occupancy'] / daily_stats['total_spaces']) * 100
-        
+        # Daily statistics are aggregated in the database (cached per date range)
+        daily_stats = load_daily_stats(start_date, end_date)
+
         # Plot daily statistics
         st.subheader("Daily Occupancy Statistics")
         
@@ -403,50 +771,34 @@ elif page == "Historical Data":
         
         # Day of week patterns
         st.subheader("Day of Week Patterns")
-        
-        # Calculate average occupancy by day of week and hour
-        dow_hourly = filtered_data.groupby(['day_of_week', 'hour']).agg({
-            'occupancy': 'mean',
-            'total_spaces': 'first'
-        }).reset_index()
-        
-        dow_hourly['occupancy_pct'] = (dow_hourly['occupancy'] / dow_hourly['total_spaces']) * 100
-        
-        # Create a pivot table for heatmap
-        pivot_data = dow_hourly.pivot(index='hour', columns='day_of_week', values='occupancy_pct')
-        
-        # Create a heatmap using Plotly
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
-        fig = px.imshow(
-            pivot_data,
-            labels=dict(x="Day of Week", y="Hour of Day", color="Occupancy %"),
-            x=[days[i] for i in pivot_data.columns],
-            y=pivot_data.index,
-            aspect="auto",
-            color_continuous_scale="RdYlGn_r"
-        )
-        
-        fig.update_layout(
-            title='Occupancy Heatmap by Day and Hour',
-            xaxis_title='Day of Week',
-            yaxis_title='Hour of Day',
-            coloraxis_colorbar=dict(title='Occupancy %')
-        )
-        
+
+        # Heatmap figure is cached per date range and data version
+        fig = build_heatmap_figure(filtered_data, start_date, end_date)
         st.plotly_chart(fig, use_container_width=True)
         
         # Monthly trends if data spans multiple months
         if (filtered_data['timestamp'].max() - filtered_data['timestamp'].min()).days > 30:
             st.subheader("Monthly Trends")
             
-            monthly_data = filtered_data.groupby(pd.Grouper(key='timestamp', freq='M')).agg({
+            # Group on an integer month bucket so the aggregation stays on
+            # pandas' int64 hash-aggregate fast path instead of the Grouper
+            # resampling machinery
+            ts = filtered_data['timestamp']
+            year_month = (ts.dt.year.to_numpy() * 12 + ts.dt.month.to_numpy() - 1).astype(np.int32)
+            monthly_data = filtered_data.groupby(year_month, sort=True).agg({
                 'occupancy': 'mean',
                 'total_spaces': 'first'
-            }).reset_index()
-            
-            monthly_data['month'] = monthly_data['timestamp'].dt.strftime('%B %Y')
-            monthly_data['occupancy_pct'] = (monthly_data['occupancy'] / monthly_data['total_spaces']) * 100
+            }).reset_index(names='year_month')
+
+            # Build month labels from integer month/year arrays rather than
+            # per-row strftime (object-dtype) conversion
+            month_names = np.array(['January', 'February', 'March', 'April', 'May', 'June',
+                                    'July', 'August', 'September', 'October', 'November', 'December'])
+            ym = monthly_data['year_month'].to_numpy()
+            monthly_data = monthly_data.assign(
+                month=pd.Series(month_names[ym % 12]) + ' ' + pd.Series(ym // 12).astype(str),
+                occupancy_pct=(monthly_data['occupancy'] / monthly_data['total_spaces']) * 100
+            )
             
             fig = px.bar(
                 monthly_data,
@@ -495,23 +847,25 @@ elif page == "Management":
                 else:
                     # Add the new parking lot to the database
                     new_lot = db.add_parking_lot(lot_name, total_spaces, latitude, longitude)
+                    # Invalidate caches that now hold stale lot data
+                    load_parking_lots.clear()
+                    lot_name_to_id.clear()
+                    lots_dataframe.clear()
+                    load_database_stats.clear()
                     st.success(f"Parking lot '{lot_name}' added successfully with ID: {new_lot.id}")
         
-        # Display existing parking lots
-        st.subheader("Existing Parking Lots")
-        lots = db.get_parking_lots()
-        if lots:
-            lot_data = []
-            for lot in lots:
-                lot_data.append({
-                    "ID": lot.id,
-                    "Name": lot.name,
-                    "Total Spaces": lot.total_spaces,
-                    "Location": f"({lot.latitude}, {lot.longitude})"
-                })
-            st.dataframe(lot_data)
-        else:
-            st.info("No parking lots found in the database")
+        # Display existing parking lots in a fragment so form keystrokes
+        # don't rerun the listing
+        @st.fragment
+        def existing_lots_view():
+            st.subheader("Existing Parking Lots")
+            lots_df = lots_dataframe()
+            if len(lots_df) > 0:
+                st.dataframe(lots_df)
+            else:
+                st.info("No parking lots found in the database")
+
+        existing_lots_view()
     
     # Add Parking Area tab
     with tabs[1]:
@@ -519,13 +873,13 @@ elif page == "Management":
         st.markdown("Add a specific area/section to an existing parking lot")
         
         # Get parking lots for selection
-        lots = db.get_parking_lots()
+        lots = load_parking_lots()
         if not lots:
             st.warning("No parking lots available. Please add a parking lot first.")
         else:
             # Form for adding a new parking area
             with st.form("add_area_form"):
-                lot_options = {lot.name: lot.id for lot in lots}
+                lot_options = lot_name_to_id()
                 selected_lot = st.selectbox("Select Parking Lot", options=list(lot_options.keys()))
                 area_name = st.text_input("Area Name", placeholder="e.g., Level 1 - North")
                 area_spaces = st.number_input("Number of Spaces in Area", min_value=1, value=50)
@@ -539,23 +893,34 @@ elif page == "Management":
                         # Add the new parking area to the database
                         lot_id = lot_options[selected_lot]
                         new_area = db.add_parking_area(area_name, area_spaces, lot_id)
+                        # Invalidate caches that now hold stale area data
+                        load_parking_areas.clear()
+                        load_areas_grouped.clear()
+                        load_database_stats.clear()
                         st.success(f"Parking area '{area_name}' added successfully to '{selected_lot}'")
             
-            # Display existing areas for each lot
-            for lot in lots:
-                st.subheader(f"Areas in {lot.name}")
-                areas = db.get_parking_areas(lot.id)
-                if areas:
-                    area_data = []
-                    for area in areas:
-                        area_data.append({
-                            "ID": area.id,
-                            "Name": area.name,
-                            "Spaces": area.total_spaces
-                        })
-                    st.dataframe(area_data)
-                else:
-                    st.info(f"No areas defined for {lot.name}")
+            # Display existing areas for each lot in a fragment so typing in
+            # the form above doesn't re-query them
+            @st.fragment
+            def existing_areas_view():
+                # One grouped query instead of one areas query per lot
+                areas_by_lot = load_areas_grouped()
+                for lot in lots:
+                    st.subheader(f"Areas in {lot.name}")
+                    areas = areas_by_lot.get(lot.id, [])
+                    if areas:
+                        area_data = []
+                        for area in areas:
+                            area_data.append({
+                                "ID": area.id,
+                                "Name": area.name,
+                                "Spaces": area.total_spaces
+                            })
+                        st.dataframe(area_data)
+                    else:
+                        st.info(f"No areas defined for {lot.name}")
+
+            existing_areas_view()
     
     # Database Statistics tab
     with tabs[2]:
@@ -563,7 +928,7 @@ elif page == "Management":
         st.markdown("Overview of the parking system database")
         
         # Get database statistics
-        stats = db.get_database_stats()
+        stats = load_database_stats()
         
         # Display statistics in metrics
         col1, col2, col3 = st.columns(3)
@@ -595,6 +960,15 @@ elif page == "Management":
                 # Re-initialize the database
                 db.init_db()
                 db.seed_database()
+                # Drop every cached read so the fresh data is picked up
+                load_historical_data.clear()
+                load_current_occupancy.clear()
+                load_parking_lots.clear()
+                load_parking_areas.clear()
+                load_areas_grouped.clear()
+                lot_name_to_id.clear()
+                lots_dataframe.clear()
+                load_database_stats.clear()
                 st.success("Database reinitialized successfully")
                 st.rerun()
 
@@ -703,7 +1077,7 @@ elif page == "Student Resources":
         
         # Display campus map with interactive elements
         st.markdown("### Interactive Campus Map")
-        map_data = create_parking_map(st.session_state.real_time_data)
+        map_data = render_parking_map(st.session_state.real_time_data)
         st_folium(map_data, width=700, height=500, returned_objects=[])
     
     # Bull Runner tab
@@ -816,75 +1190,10 @@ elif page == "About":
     st.title("About USF Parking System")
     
     # Display USF logo
-    st.markdown("""
-    <div style="text-align: center; margin-bottom: 20px;">
-        <img src="https://www.usf.edu/identity/images/logos-and-brand-assets/usf-logo-color-rgb.png" width="400">
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("""
-    ## Overview
-    
-    The USF Parking System is an AI-powered application that provides real-time monitoring and prediction of parking availability across the University of South Florida's Tampa campus. The system aims to help students, faculty, staff, and visitors find parking more efficiently, reduce congestion, and improve the overall parking experience at USF.
-    
-    ### Key Features
-    
-    - **Real-time Monitoring**: Track current parking occupancy across different areas
-    - **Interactive Visualization**: Visual representation of parking spaces with status indicators
-    - **Predictive Analytics**: Machine learning algorithms to forecast future parking availability
-    - **Historical Analysis**: Explore past usage patterns to identify trends and peak periods
-    
-    ### Technology Stack
-    
-    - **Frontend**: Streamlit for interactive web interface
-    - **Database**: PostgreSQL for data storage and retrieval
-    - **Data Processing**: Pandas and NumPy for data manipulation
-    - **ORM**: SQLAlchemy for database interactions
-    - **Machine Learning**: Scikit-learn for predictive models
-    - **Visualization**: Plotly and Folium for interactive charts and maps
-    
-    ### Data Sources
-    
-    In a production environment, this system would integrate with:
-    
-    - Smart parking sensors
-    - Camera-based occupancy detection
-    - Ticket systems and parking gates
-    - Weather APIs and event calendars for improved predictions
-    
-    For this demonstration, we use a PostgreSQL database with simulated data that mimics real-world parking patterns.
-    
-    ### Future Enhancements
-    
-    - Integration with mobile apps for navigation
-    - Advanced prediction models incorporating weather and events
-    - Reservation systems and payment integration
-    - Multi-site parking management
-    """)
+    st.markdown(_ABOUT_LOGO_HTML, unsafe_allow_html=True)
+
+    st.markdown(_ABOUT_MD)
 
     st.markdown("---")
-    
-    st.markdown("""
-    ## How It Works
-    
-    ### Data Collection
-    
-    The system continuously collects occupancy data from parking sensors or cameras. This data is processed and stored to provide real-time updates and historical analysis.
-    
-    ### Prediction Algorithm
-    
-    Our machine learning model analyzes historical patterns to predict future parking availability. The model considers:
-    
-    - Day of the week
-    - Time of day
-    - Historical occupancy patterns
-    - Recent trends
-    
-    ### Visualization Engine
-    
-    The dashboard displays real-time and historical data through interactive charts and maps. Users can:
-    
-    - View current availability by parking area
-    - Analyze historical trends and patterns
-    - Predict future availability for planning
-    """)
+
+    st.markdown(_HOW_IT_WORKS_MD)
@@ -2,6 +2,9 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+# Shared PCG64 generator; faster than the legacy np.random global state
+_rng = np.random.default_rng()
+
 def generate_parking_data(start_time, end_time, interval_minutes=15, total_spaces=200):
     """
     Generate simulated parking data for a given time period.
@@ -15,68 +18,51 @@ def generate_parking_data(start_time, end_time, interval_minutes=15, total_space
     Returns:
     - DataFrame with simulated parking data
     """
-    # Calculate number of time points
-    time_diff = end_time - start_time
-    total_minutes = time_diff.total_seconds() / 60
-    num_points = int(total_minutes / interval_minutes) + 1
-    
+    rng = _rng
+
     # Create time points
-    time_points = [start_time + timedelta(minutes=i*interval_minutes) for i in range(num_points)]
-    
-    # Base occupancy patterns
+    times = pd.date_range(start_time, end_time, freq=f'{interval_minutes}min')
+    num_points = len(times)
+
+    hours = times.hour.to_numpy()
+    days_of_week = times.weekday.to_numpy()
+    is_weekday = days_of_week < 5
+
+    # Base occupancy percentage (30-40%)
+    occupancy_pct = rng.uniform(0.3, 0.4, num_points)
+
+    # Base occupancy patterns as boolean masks over all time points at once
     # Weekday pattern: peak at 9-10 AM and 4-6 PM
     # Weekend pattern: peak at 11 AM - 3 PM
-    
-    data = []
-    for t in time_points:
-        day_of_week = t.weekday()  # 0-6 where 0 is Monday
-        hour = t.hour
-        minute = t.minute
-        
-        # Base occupancy percentage (30-40%)
-        base_occupancy_pct = np.random.uniform(0.3, 0.4)
-        
-        # Add time-based patterns
-        if day_of_week < 5:  # Weekday
-            # Morning peak (8-10 AM)
-            if 8 <= hour < 10:
-                base_occupancy_pct += np.random.uniform(0.3, 0.5)
-            # Lunch peak (12-2 PM)
-            elif 12 <= hour < 14:
-                base_occupancy_pct += np.random.uniform(0.15, 0.3)
-            # Evening peak (4-6 PM)
-            elif 16 <= hour < 18:
-                base_occupancy_pct += np.random.uniform(0.25, 0.45)
-            # Late night (10 PM - 6 AM)
-            elif hour >= 22 or hour < 6:
-                base_occupancy_pct -= np.random.uniform(0.15, 0.25)
-        else:  # Weekend
-            # Mid-day peak (11 AM - 3 PM)
-            if 11 <= hour < 15:
-                base_occupancy_pct += np.random.uniform(0.3, 0.5)
-            # Evening (7-9 PM)
-            elif 19 <= hour < 21:
-                base_occupancy_pct += np.random.uniform(0.2, 0.4)
-            # Late night (11 PM - 8 AM)
-            elif hour >= 23 or hour < 8:
-                base_occupancy_pct -= np.random.uniform(0.2, 0.3)
-        
-        # Ensure occupancy is within bounds (5-95%)
-        occupancy_pct = max(0.05, min(0.95, base_occupancy_pct))
-        
-        # Calculate actual number of occupied spaces
-        occupancy = int(occupancy_pct * total_spaces)
-        
-        data.append({
-            'timestamp': t,
-            'occupancy': occupancy,
-            'total_spaces': total_spaces,
-            'day_of_week': day_of_week,
-            'hour': hour,
-            'minute': minute
-        })
-    
-    return pd.DataFrame(data)
+    morning_peak = is_weekday & (hours >= 8) & (hours < 10)
+    lunch_peak = is_weekday & (hours >= 12) & (hours < 14)
+    evening_peak = is_weekday & (hours >= 16) & (hours < 18)
+    late_night = is_weekday & ((hours >= 22) | (hours < 6))
+    weekend_midday = ~is_weekday & (hours >= 11) & (hours < 15)
+    weekend_evening = ~is_weekday & (hours >= 19) & (hours < 21)
+    weekend_late = ~is_weekday & ((hours >= 23) | (hours < 8))
+
+    occupancy_pct[morning_peak] += rng.uniform(0.3, 0.5, morning_peak.sum())
+    occupancy_pct[lunch_peak] += rng.uniform(0.15, 0.3, lunch_peak.sum())
+    occupancy_pct[evening_peak] += rng.uniform(0.25, 0.45, evening_peak.sum())
+    occupancy_pct[late_night] -= rng.uniform(0.15, 0.25, late_night.sum())
+    occupancy_pct[weekend_midday] += rng.uniform(0.3, 0.5, weekend_midday.sum())
+    occupancy_pct[weekend_evening] += rng.uniform(0.2, 0.4, weekend_evening.sum())
+    occupancy_pct[weekend_late] -= rng.uniform(0.2, 0.3, weekend_late.sum())
+
+    # Ensure occupancy is within bounds (5-95%)
+    occupancy_pct = np.clip(occupancy_pct, 0.05, 0.95)
+
+    # Narrow integer dtypes: the widest value here is total_spaces, which
+    # comfortably fits int16, and the time parts fit int8
+    return pd.DataFrame({
+        'timestamp': times,
+        'occupancy': (occupancy_pct * total_spaces).astype(np.int16),
+        'total_spaces': np.full(num_points, total_spaces, np.int16),
+        'day_of_week': days_of_week.astype(np.int8),
+        'hour': hours.astype(np.int8),
+        'minute': times.minute.to_numpy().astype(np.int8)
+    })
 
 def get_current_occupancy(total_spaces=200):
     """
@@ -104,45 +90,41 @@ def get_current_occupancy(total_spaces=200):
     # Calculate base occupancy based on time patterns
     if day_of_week < 5:  # Weekday
         if 8 <= hour < 10:  # Morning peak
-            base_occupancy_pct = np.random.uniform(0.7, 0.9)
+            base_occupancy_pct = _rng.uniform(0.7, 0.9)
         elif 12 <= hour < 14:  # Lunch peak
-            base_occupancy_pct = np.random.uniform(0.5, 0.7)
+            base_occupancy_pct = _rng.uniform(0.5, 0.7)
         elif 16 <= hour < 18:  # Evening peak
-            base_occupancy_pct = np.random.uniform(0.65, 0.85)
+            base_occupancy_pct = _rng.uniform(0.65, 0.85)
         elif hour >= 22 or hour < 6:  # Late night
-            base_occupancy_pct = np.random.uniform(0.1, 0.25)
+            base_occupancy_pct = _rng.uniform(0.1, 0.25)
         else:  # Regular hours
-            base_occupancy_pct = np.random.uniform(0.4, 0.6)
+            base_occupancy_pct = _rng.uniform(0.4, 0.6)
     else:  # Weekend
         if 11 <= hour < 15:  # Mid-day peak
-            base_occupancy_pct = np.random.uniform(0.6, 0.8)
+            base_occupancy_pct = _rng.uniform(0.6, 0.8)
         elif 19 <= hour < 21:  # Evening
-            base_occupancy_pct = np.random.uniform(0.5, 0.7)
+            base_occupancy_pct = _rng.uniform(0.5, 0.7)
         elif hour >= 23 or hour < 8:  # Late night
-            base_occupancy_pct = np.random.uniform(0.1, 0.2)
+            base_occupancy_pct = _rng.uniform(0.1, 0.2)
         else:  # Regular hours
-            base_occupancy_pct = np.random.uniform(0.3, 0.5)
-    
-    # Calculate occupancy for each area with some variability
-    total_occupied = 0
-    for area_name, area_data in areas.items():
-        # Add variability to each area
-        area_modifier = np.random.uniform(0.8, 1.2)
-        area_occupancy_pct = base_occupancy_pct * area_modifier
-        
-        # Ensure within bounds
-        area_occupancy_pct = max(0.05, min(0.95, area_occupancy_pct))
-        
-        # Special case for VIP area (typically less occupied)
-        if area_name == "Area D - VIP":
-            area_occupancy_pct *= 0.7
-        
-        occupied = int(area_occupancy_pct * area_data["total"])
-        areas[area_name]["occupied"] = occupied
-        areas[area_name]["available"] = area_data["total"] - occupied
-        areas[area_name]["occupancy_pct"] = area_occupancy_pct * 100
-        
-        total_occupied += occupied
+            base_occupancy_pct = _rng.uniform(0.3, 0.5)
+
+    # Calculate occupancy for all areas in one vectorized step
+    area_names = list(areas)
+    totals = np.array([areas[name]["total"] for name in area_names])
+    area_modifiers = _rng.uniform(0.8, 1.2, len(area_names))
+    area_pcts = np.clip(base_occupancy_pct * area_modifiers, 0.05, 0.95)
+
+    # Special case for VIP area (typically less occupied)
+    area_pcts[area_names.index("Area D - VIP")] *= 0.7
+
+    occupied_counts = (area_pcts * totals).astype(int)
+    total_occupied = int(occupied_counts.sum())
+
+    for area_name, total, occupied, pct in zip(area_names, totals, occupied_counts, area_pcts):
+        areas[area_name]["occupied"] = int(occupied)
+        areas[area_name]["available"] = int(total - occupied)
+        areas[area_name]["occupancy_pct"] = float(pct * 100)
     
     # Create return object
     return {
@@ -1,7 +1,9 @@
 import os
+import time
+from contextlib import contextmanager
 import pandas as pd
 import numpy as np
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, ForeignKey, Table, MetaData
+from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, ForeignKey, Table, MetaData, func, Index, select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime, timedelta
@@ -10,10 +12,41 @@ from datetime import datetime, timedelta
 DATABASE_URL = os.getenv("DATABASE_URL")
 
 # Create SQLAlchemy engine and session
-engine = create_engine(DATABASE_URL)
-Session = sessionmaker(bind=engine)
+# Keep a pool of warm connections: the app issues many short queries per
+# refresh, so per-call connection setup would dominate
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=8,
+    max_overflow=4,
+    pool_pre_ping=True,   # drop stale connections instead of erroring mid-query
+    pool_recycle=1800,    # recycle before server-side idle timeouts hit
+    pool_use_lifo=True,   # reuse the hottest backend; idle overflow closes sooner
+    future=True
+)
+# expire_on_commit=False keeps returned ORM objects readable after commit
+# without a re-SELECT, which the add_* helpers rely on
+Session = sessionmaker(bind=engine, expire_on_commit=False)
 Base = declarative_base()
 
+# Shared PCG64 generator for simulated occupancy values
+_rng = np.random.default_rng()
+
+@contextmanager
+def session_scope():
+    """
+    Provide a transactional session: commits on success, rolls back on error.
+    Write helpers share this so commit/rollback handling lives in one place.
+    """
+    session = Session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
 # Define database models
 class ParkingLot(Base):
     __tablename__ = 'parking_lots'
@@ -45,14 +78,22 @@ class OccupancyRecord(Base):
     __tablename__ = 'occupancy_records'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False)
+    # Let the server stamp the row when no explicit timestamp is passed
+    timestamp = Column(DateTime, nullable=False, server_default=func.now())
     occupied_spaces = Column(Integer, nullable=False)
     lot_id = Column(Integer, ForeignKey('parking_lots.id'), nullable=False)
     area_id = Column(Integer, ForeignKey('parking_areas.id'))
-    day_of_week = Column(Integer)  # 0-6, where 0 is Monday
-    hour = Column(Integer)
-    minute = Column(Integer)
-    
+    # day_of_week/hour/minute are not stored: they are derivable from
+    # timestamp and get recomputed in pandas after retrieval
+
+    # Index the (area/lot, timestamp) pairs so the hot filters become index-range
+    # scans; including occupied_spaces makes the latest-per-area lookup an
+    # index-only scan with no heap fetch
+    __table_args__ = (
+        Index('ix_occ_area_ts', 'area_id', 'timestamp', postgresql_include=['occupied_spaces']),
+        Index('ix_occ_lot_ts', 'lot_id', 'timestamp'),
+    )
+
     # Relationships
     lot = relationship("ParkingLot", back_populates="occupancy_records")
     area = relationship("ParkingArea", back_populates="occupancy_records")
@@ -75,32 +116,57 @@ def init_db():
     """Initialize the database by creating all tables."""
     Base.metadata.create_all(engine)
 
+# Lots and areas are read-mostly configuration; a short in-process TTL
+# cache spares a DB round trip per UI refresh. The add_* helpers clear it.
+_META_CACHE_TTL = 60
+_meta_cache = {}
+
+def _meta_cached(key, loader):
+    """Return the cached value for key, reloading it once the TTL expires."""
+    entry = _meta_cache.get(key)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < _META_CACHE_TTL:
+        return entry[1]
+    value = loader()
+    _meta_cache[key] = (now, value)
+    return value
+
 def get_parking_lots():
-    """Get all parking lots from the database."""
-    session = Session()
-    try:
-        return session.query(ParkingLot).all()
-    finally:
-        session.close()
+    """Get all parking lots from the database (cached briefly in-process)."""
+    def _load():
+        with Session() as session:
+            return session.query(ParkingLot).all()
+    return _meta_cached('lots', _load)
 
 def get_parking_areas(lot_id=None):
-    """Get all parking areas, optionally filtered by lot_id."""
-    session = Session()
-    try:
-        query = session.query(ParkingArea)
-        if lot_id:
-            query = query.filter(ParkingArea.lot_id == lot_id)
-        return query.all()
-    finally:
-        session.close()
+    """Get all parking areas, optionally filtered by lot_id (cached briefly in-process)."""
+    def _load():
+        with Session() as session:
+            query = session.query(ParkingArea)
+            if lot_id:
+                query = query.filter(ParkingArea.lot_id == lot_id)
+            return query.all()
+    return _meta_cached(('areas', lot_id), _load)
+
+def get_all_areas_grouped():
+    """
+    Get every parking area in a single query, grouped by lot.
+
+    Returns:
+    - Dictionary mapping lot_id to a list of ParkingArea objects
+    """
+    with Session() as session:
+        areas_by_lot = {}
+        for area in session.query(ParkingArea).order_by(ParkingArea.lot_id, ParkingArea.id).all():
+            areas_by_lot.setdefault(area.lot_id, []).append(area)
+        return areas_by_lot
 
 def get_current_occupancy():
     """
     Get current occupancy data from the database.
     If no recent data (within last 15 minutes) exists, returns a simulated occupancy.
     """
-    session = Session()
-    try:
+    with Session() as session:
         # Get all parking lots
         lots = session.query(ParkingLot).all()
         
@@ -115,32 +181,43 @@ def get_current_occupancy():
                 "areas": {}
             }
         
-        # Get the most recent occupancy record for each area
+        # Get the most recent occupancy record for every area in one
+        # window-function query instead of one query per area
         recent_time = datetime.now() - timedelta(minutes=15)
-        recent_records = {}
-        
+        latest = session.query(
+            OccupancyRecord.area_id,
+            OccupancyRecord.occupied_spaces,
+            func.row_number().over(
+                partition_by=OccupancyRecord.area_id,
+                order_by=OccupancyRecord.timestamp.desc()
+            ).label('rn')
+        ).filter(
+            OccupancyRecord.timestamp > recent_time,
+            OccupancyRecord.area_id.isnot(None)
+        ).subquery()
+
+        recent_records = dict(
+            session.query(latest.c.area_id, latest.c.occupied_spaces)
+            .filter(latest.c.rn == 1).all()
+        )
+
+        # Fetch every area once and group by lot instead of one query per lot
+        areas_by_lot = {}
+        for area in session.query(ParkingArea).all():
+            areas_by_lot.setdefault(area.lot_id, []).append(area)
+
         total_spaces = 0
         total_occupied = 0
         areas_data = {}
-        
+
         for lot in lots:
             total_spaces += lot.total_spaces
-            
-            # Get areas for this lot
-            lot_areas = session.query(ParkingArea).filter(ParkingArea.lot_id == lot.id).all()
-            
-            for area in lot_areas:
-                # Get most recent record for this area
-                recent_record = session.query(OccupancyRecord).filter(
-                    OccupancyRecord.area_id == area.id,
-                    OccupancyRecord.timestamp > recent_time
-                ).order_by(OccupancyRecord.timestamp.desc()).first()
-                
-                if recent_record:
-                    occupied = recent_record.occupied_spaces
-                else:
+
+            for area in areas_by_lot.get(lot.id, []):
+                occupied = recent_records.get(area.id)
+                if occupied is None:
                     # If no recent record, simulate one (50% occupancy with some randomness)
-                    occupied = int(area.total_spaces * np.random.uniform(0.3, 0.7))
+                    occupied = int(area.total_spaces * _rng.uniform(0.3, 0.7))
                 
                 total_occupied += occupied
                 
@@ -160,53 +237,116 @@ def get_current_occupancy():
             "occupancy_pct": (total_occupied / total_spaces) * 100 if total_spaces > 0 else 0,
             "areas": areas_data
         }
-    finally:
-        session.close()
 
-def get_historical_data(days=7):
+def get_historical_data(days=7, columns=None):
     """
     Get historical occupancy data from the database.
-    
+
     Parameters:
     - days: Number of days to look back
-    
+    - columns: Optional iterable of column names to fetch; defaults to all.
+      Projecting only the needed columns keeps the query and the resulting
+      DataFrame narrow.
+
     Returns:
     - DataFrame with historical data
     """
-    session = Session()
-    try:
-        # Calculate start date
-        start_date = datetime.now() - timedelta(days=days)
-        
-        # Get records
-        records = session.query(OccupancyRecord).filter(
-            OccupancyRecord.timestamp >= start_date
-        ).order_by(OccupancyRecord.timestamp).all()
-        
-        if not records:
-            # If no records, return empty DataFrame with expected columns
-            return pd.DataFrame(columns=[
-                'timestamp', 'occupancy', 'total_spaces', 
-                'day_of_week', 'hour', 'minute'
-            ])
-        
-        # Convert to DataFrame
-        data = []
-        for record in records:
-            data.append({
-                'timestamp': record.timestamp,
-                'occupancy': record.occupied_spaces,
-                'total_spaces': record.lot.total_spaces,
-                'day_of_week': record.day_of_week,
-                'hour': record.hour,
-                'minute': record.minute,
-                'lot_id': record.lot_id,
-                'area_id': record.area_id
-            })
-        
-        return pd.DataFrame(data)
-    finally:
-        session.close()
+    # Map result columns to the expressions that produce them; the time parts
+    # are not stored and get derived from timestamp after retrieval
+    column_map = {
+        'timestamp': OccupancyRecord.timestamp,
+        'occupancy': OccupancyRecord.occupied_spaces,
+        'total_spaces': ParkingLot.total_spaces,
+        'lot_id': OccupancyRecord.lot_id,
+        'area_id': OccupancyRecord.area_id
+    }
+    derived = ('day_of_week', 'hour', 'minute')
+    if columns is None:
+        selected = list(column_map)
+        wanted_derived = list(derived)
+    else:
+        selected = [c for c in columns if c in column_map]
+        wanted_derived = [c for c in columns if c in derived]
+        if wanted_derived and 'timestamp' not in selected:
+            selected.insert(0, 'timestamp')
+
+    # Calculate start date
+    start_date = datetime.now() - timedelta(days=days)
+
+    # Fetch only the projected columns, joining the lot for total_spaces, and
+    # let pandas read the result straight off the cursor instead of routing
+    # every row through Python tuples
+    stmt = select(
+        *[column_map[c].label(c) for c in selected]
+    ).select_from(OccupancyRecord).join(
+        ParkingLot, OccupancyRecord.lot_id == ParkingLot.id
+    ).where(
+        OccupancyRecord.timestamp >= start_date
+    ).order_by(OccupancyRecord.timestamp)
+
+    # Stream over a server-side cursor so memory stays bounded by the row
+    # buffer rather than growing with the length of the history
+    with engine.connect().execution_options(stream_results=True, max_row_buffer=1000) as conn:
+        df = pd.read_sql_query(
+            stmt,
+            conn,
+            parse_dates=['timestamp'] if 'timestamp' in selected else None
+        )
+
+    # Vectorized .dt accessors are near-free compared to storing three extra
+    # integer columns per row in the database
+    if 'day_of_week' in wanted_derived:
+        df['day_of_week'] = df['timestamp'].dt.dayofweek
+    if 'hour' in wanted_derived:
+        df['hour'] = df['timestamp'].dt.hour
+    if 'minute' in wanted_derived:
+        df['minute'] = df['timestamp'].dt.minute
+
+    return df
+
+def get_daily_stats(start_date, end_date):
+    """
+    Get per-day occupancy statistics, aggregated in the database.
+
+    Parameters:
+    - start_date: First day to include (date)
+    - end_date: Last day to include (date)
+
+    Returns:
+    - DataFrame with one row per day: date, avg/max/min occupancy and percentages
+    """
+    with Session() as session:
+        day = func.date_trunc('day', OccupancyRecord.timestamp).label('date')
+
+        # Let the database do the GROUP BY instead of scanning rows in pandas
+        rows = session.query(
+            day,
+            func.avg(OccupancyRecord.occupied_spaces).label('avg_occupancy'),
+            func.max(OccupancyRecord.occupied_spaces).label('max_occupancy'),
+            func.min(OccupancyRecord.occupied_spaces).label('min_occupancy'),
+            func.max(ParkingLot.total_spaces).label('total_spaces')
+        ).join(
+            ParkingLot, OccupancyRecord.lot_id == ParkingLot.id
+        ).filter(
+            OccupancyRecord.timestamp >= start_date,
+            OccupancyRecord.timestamp < end_date + timedelta(days=1)
+        ).group_by(day).order_by(day).all()
+
+        daily_stats = pd.DataFrame(rows, columns=[
+            'date', 'avg_occupancy', 'max_occupancy', 'min_occupancy', 'total_spaces'
+        ])
+
+        if len(daily_stats) > 0:
+            daily_stats['avg_occupancy'] = daily_stats['avg_occupancy'].astype(float)
+            total = daily_stats['total_spaces'].to_numpy(dtype=float)
+            # Derive all percentage columns in one assignment pass
+            daily_stats = daily_stats.assign(
+                avg_pct=daily_stats['avg_occupancy'].to_numpy() / total * 100,
+                max_pct=daily_stats['max_occupancy'].to_numpy() / total * 100,
+                min_pct=daily_stats['min_occupancy'].to_numpy() / total * 100
+            )
+
+        return daily_stats
 
 def add_occupancy_record(lot_id, occupied_spaces, area_id=None, timestamp=None):
     """
@@ -221,29 +361,50 @@ def add_occupancy_record(lot_id, occupied_spaces, area_id=None, timestamp=None):
     Returns:
     - The created record
     """
-    if timestamp is None:
-        timestamp = datetime.now()
-    
-    session = Session()
-    try:
-        # Create new record
+    with session_scope() as session:
+        # Create new record (a narrow row; the server fills timestamp when
+        # none is supplied, and time parts are derived on read)
         record = OccupancyRecord(
-            timestamp=timestamp,
             occupied_spaces=occupied_spaces,
             lot_id=lot_id,
-            area_id=area_id,
-            day_of_week=timestamp.weekday(),
-            hour=timestamp.hour,
-            minute=timestamp.minute
+            area_id=area_id
         )
-        
+        if timestamp is not None:
+            record.timestamp = timestamp
+
         # Add to database
         session.add(record)
-        session.commit()
-        
-        return record
-    finally:
-        session.close()
+
+    return record
+
+def add_occupancy_records_bulk(records):
+    """
+    Add multiple occupancy records in a single INSERT statement.
+
+    Parameters:
+    - records: List of dicts with keys lot_id, occupied_spaces and optionally
+      area_id and timestamp (defaults to current time)
+
+    Returns:
+    - Number of records inserted
+    """
+    rows = []
+    for record in records:
+        rows.append({
+            'timestamp': record.get('timestamp') or datetime.now(),
+            'occupied_spaces': record['occupied_spaces'],
+            'lot_id': record['lot_id'],
+            'area_id': record.get('area_id')
+        })
+
+    if not rows:
+        return 0
+
+    with session_scope() as session:
+        # One executemany round-trip and one commit instead of N INSERTs
+        session.execute(OccupancyRecord.__table__.insert(), rows)
+
+    return len(rows)
 
 def add_parking_lot(name, total_spaces, latitude=None, longitude=None):
     """
@@ -258,8 +419,7 @@ def add_parking_lot(name, total_spaces, latitude=None, longitude=None):
     Returns:
     - The created parking lot
     """
-    session = Session()
-    try:
+    with session_scope() as session:
         # Create new parking lot
         lot = ParkingLot(
             name=name,
@@ -267,14 +427,14 @@ def add_parking_lot(name, total_spaces, latitude=None, longitude=None):
             latitude=latitude,
             longitude=longitude
         )
-        
+
         # Add to database
         session.add(lot)
-        session.commit()
-        
-        return lot
-    finally:
-        session.close()
+
+    # New lot: drop the cached metadata
+    _meta_cache.clear()
+
+    return lot
 
 def add_parking_area(name, total_spaces, lot_id, permit_type="All"):
     """
@@ -289,8 +449,7 @@ def add_parking_area(name, total_spaces, lot_id, permit_type="All"):
     Returns:
     - The created parking area
     """
-    session = Session()
-    try:
+    with session_scope() as session:
         # Create new parking area
         area = ParkingArea(
             name=name,
@@ -298,14 +457,14 @@ def add_parking_area(name, total_spaces, lot_id, permit_type="All"):
             lot_id=lot_id,
             permit_type=permit_type
         )
-        
+
         # Add to database
         session.add(area)
-        session.commit()
-        
-        return area
-    finally:
-        session.close()
+
+    # New area: drop the cached metadata
+    _meta_cache.clear()
+
+    return area
 
 def get_database_stats():
     """
@@ -314,38 +473,33 @@ def get_database_stats():
     Returns:
     - Dictionary with database statistics
     """
-    session = Session()
-    try:
-        stats = {}
-        
-        # Count parking lots
-        stats['total_lots'] = session.query(ParkingLot).count()
-        
-        # Count parking areas
-        stats['total_areas'] = session.query(ParkingArea).count()
-        
-        # Count occupancy records
-        stats['total_records'] = session.query(OccupancyRecord).count()
-        
-        # Count USF permits
-        stats['total_permits'] = session.query(USFPermit).count()
-        
-        # Get earliest and latest timestamps
-        earliest_record = session.query(OccupancyRecord).order_by(OccupancyRecord.timestamp).first()
-        latest_record = session.query(OccupancyRecord).order_by(OccupancyRecord.timestamp.desc()).first()
-        
-        if earliest_record and latest_record:
-            stats['earliest_timestamp'] = earliest_record.timestamp
-            stats['latest_timestamp'] = latest_record.timestamp
-            stats['days_of_data'] = (latest_record.timestamp - earliest_record.timestamp).days
-        
-        # Count total parking spaces
-        total_spaces = session.query(ParkingLot.total_spaces).all()
-        stats['total_spaces'] = sum([spaces[0] for spaces in total_spaces])
-        
+    with Session() as session:
+        # All counts, timestamp bounds and the space total in a single round
+        # trip instead of seven separate queries
+        row = session.execute(select(
+            select(func.count()).select_from(ParkingLot).scalar_subquery().label('total_lots'),
+            select(func.count()).select_from(ParkingArea).scalar_subquery().label('total_areas'),
+            select(func.count()).select_from(OccupancyRecord).scalar_subquery().label('total_records'),
+            select(func.count()).select_from(USFPermit).scalar_subquery().label('total_permits'),
+            select(func.min(OccupancyRecord.timestamp)).scalar_subquery().label('earliest_timestamp'),
+            select(func.max(OccupancyRecord.timestamp)).scalar_subquery().label('latest_timestamp'),
+            select(func.coalesce(func.sum(ParkingLot.total_spaces), 0)).scalar_subquery().label('total_spaces')
+        )).one()
+
+        stats = {
+            'total_lots': row.total_lots,
+            'total_areas': row.total_areas,
+            'total_records': row.total_records,
+            'total_permits': row.total_permits,
+            'total_spaces': row.total_spaces
+        }
+
+        if row.earliest_timestamp and row.latest_timestamp:
+            stats['earliest_timestamp'] = row.earliest_timestamp
+            stats['latest_timestamp'] = row.latest_timestamp
+            stats['days_of_data'] = (row.latest_timestamp - row.earliest_timestamp).days
+
         return stats
-    finally:
-        session.close()
 
 def get_usf_permits():
     """
@@ -354,11 +508,8 @@ def get_usf_permits():
     Returns:
     - List of USFPermit objects
     """
-    session = Session()
-    try:
+    with Session() as session:
         return session.query(USFPermit).all()
-    finally:
-        session.close()
 
 def add_usf_permit(permit_type, description, annual_price, valid_areas, user_type, semester_price=None):
     """
@@ -375,8 +526,7 @@ def add_usf_permit(permit_type, description, annual_price, valid_areas, user_typ
     Returns:
     - The created permit
     """
-    session = Session()
-    try:
+    with session_scope() as session:
         # Create new permit
         permit = USFPermit(
             permit_type=permit_type,
@@ -386,14 +536,82 @@ def add_usf_permit(permit_type, description, annual_price, valid_areas, user_typ
             valid_areas=valid_areas,
             user_type=user_type
         )
-        
+
         # Add to database
         session.add(permit)
-        session.commit()
-        
-        return permit
-    finally:
-        session.close()
+
+    return permit
+
+# Static seed definitions, inserted with one multi-row Core INSERT per table
+_USF_PERMIT_ROWS = [
+    # Student permits
+    {'permit_type': "S", 'description': "Resident Student Permit",
+     'annual_price': 226.00, 'semester_price': 113.00,
+     'valid_areas': "S and D designated lots/garages", 'user_type': "Resident Student"},
+    {'permit_type': "D", 'description': "Non-Resident Student Permit",
+     'annual_price': 226.00, 'semester_price': 113.00,
+     'valid_areas': "D designated lots/garages", 'user_type': "Non-Resident Student"},
+    {'permit_type': "Y", 'description': "Resident Park-n-Ride Permit",
+     'annual_price': 65.00, 'semester_price': None,
+     'valid_areas': "Lot 43 and Park-n-Ride lots", 'user_type': "Resident Student"},
+    {'permit_type': "W", 'description': "Park-n-Ride Permit",
+     'annual_price': 65.00, 'semester_price': None,
+     'valid_areas': "Park-n-Ride lots only", 'user_type': "Non-Resident Student"},
+
+    # Staff/Faculty permits
+    {'permit_type': "Gold", 'description': "Gold Staff Permit",
+     'annual_price': 1022.00, 'semester_price': 511.00,
+     'valid_areas': "Gold zones and all other non-reserved areas", 'user_type': "Faculty/Staff"},
+    {'permit_type': "GZ", 'description': "Green Staff Permit",
+     'annual_price': 428.00, 'semester_price': 214.00,
+     'valid_areas': "Green zones and student areas", 'user_type': "Faculty/Staff"},
+    {'permit_type': "E", 'description': "Evening Staff Permit",
+     'annual_price': 219.00, 'semester_price': 109.50,
+     'valid_areas': "Valid after 5:30 PM in any non-reserved space", 'user_type': "Faculty/Staff"},
+    {'permit_type': "R", 'description': "Reserved Permit",
+     'annual_price': 1603.00, 'semester_price': 801.50,
+     'valid_areas': "Reserved spaces and all non-reserved areas", 'user_type': "Faculty/Staff"},
+
+    # Other permits
+    {'permit_type': "DV", 'description': "Daily Visitor Permit",
+     'annual_price': 5.00, 'semester_price': None,
+     'valid_areas': "Visitor areas and student areas", 'user_type': "Visitor"},
+    {'permit_type': "MC", 'description': "Motorcycle Permit",
+     'annual_price': 219.00, 'semester_price': 109.50,
+     'valid_areas': "Motorcycle spaces only", 'user_type': "Any"}
+]
+
+_SEED_LOT_ROWS = [
+    {'name': "Collins Garage", 'total_spaces': 1800, 'latitude': 28.0587, 'longitude': -82.4139},
+    {'name': "Beard Garage", 'total_spaces': 1500, 'latitude': 28.0650, 'longitude': -82.4144},
+    {'name': "Laurel Garage", 'total_spaces': 1700, 'latitude': 28.0622, 'longitude': -82.4099},
+    {'name': "Crescent Hill Garage", 'total_spaces': 1600, 'latitude': 28.0643, 'longitude': -82.4119}
+]
+
+# Parking areas (by permit type); lot_id is resolved after the lots insert
+_SEED_AREA_ROWS = [
+    # Collins Garage areas
+    ("Collins Garage", {'name': "Gold Zone", 'total_spaces': 200, 'permit_type': "Gold"}),
+    ("Collins Garage", {'name': "Green Zone", 'total_spaces': 900, 'permit_type': "GZ"}),
+    ("Collins Garage", {'name': "Resident Zone", 'total_spaces': 500, 'permit_type': "S"}),
+    ("Collins Garage", {'name': "Non-Resident Zone", 'total_spaces': 200, 'permit_type': "D"}),
+
+    # Beard Garage areas
+    ("Beard Garage", {'name': "Staff Zone", 'total_spaces': 400, 'permit_type': "GZ"}),
+    ("Beard Garage", {'name': "Student Zone", 'total_spaces': 800, 'permit_type': "D"}),
+    ("Beard Garage", {'name': "Visitor Zone", 'total_spaces': 200, 'permit_type': "DV"}),
+    ("Beard Garage", {'name': "Reserved Zone", 'total_spaces': 100, 'permit_type': "R"}),
+
+    # Laurel Garage areas
+    ("Laurel Garage", {'name': "Gold Zone", 'total_spaces': 300, 'permit_type': "Gold"}),
+    ("Laurel Garage", {'name': "Green Zone", 'total_spaces': 1000, 'permit_type': "GZ"}),
+    ("Laurel Garage", {'name': "Visitor Zone", 'total_spaces': 400, 'permit_type': "DV"}),
+
+    # Crescent Hill Garage areas
+    ("Crescent Hill Garage", {'name': "Staff Zone", 'total_spaces': 500, 'permit_type': "GZ"}),
+    ("Crescent Hill Garage", {'name': "Student Zone", 'total_spaces': 900, 'permit_type': "S"}),
+    ("Crescent Hill Garage", {'name': "Visitor Zone", 'total_spaces': 200, 'permit_type': "DV"})
+]
 
 def seed_usf_permits():
     """
@@ -405,99 +623,11 @@ def seed_usf_permits():
         existing_permits = session.query(USFPermit).count()
         if existing_permits > 0:
             return
-            
-        # Create USF permits
-        permits = [
-            # Student permits
-            USFPermit(
-                permit_type="S",
-                description="Resident Student Permit",
-                annual_price=226.00,
-                semester_price=113.00,
-                valid_areas="S and D designated lots/garages",
-                user_type="Resident Student"
-            ),
-            USFPermit(
-                permit_type="D",
-                description="Non-Resident Student Permit",
-                annual_price=226.00,
-                semester_price=113.00,
-                valid_areas="D designated lots/garages",
-                user_type="Non-Resident Student"
-            ),
-            USFPermit(
-                permit_type="Y",
-                description="Resident Park-n-Ride Permit",
-                annual_price=65.00,
-                semester_price=None,
-                valid_areas="Lot 43 and Park-n-Ride lots",
-                user_type="Resident Student"
-            ),
-            USFPermit(
-                permit_type="W",
-                description="Park-n-Ride Permit",
-                annual_price=65.00,
-                semester_price=None,
-                valid_areas="Park-n-Ride lots only",
-                user_type="Non-Resident Student"
-            ),
-            
-            # Staff/Faculty permits
-            USFPermit(
-                permit_type="Gold",
-                description="Gold Staff Permit",
-                annual_price=1022.00,
-                semester_price=511.00,
-                valid_areas="Gold zones and all other non-reserved areas",
-                user_type="Faculty/Staff"
-            ),
-            USFPermit(
-                permit_type="GZ",
-                description="Green Staff Permit",
-                annual_price=428.00,
-                semester_price=214.00,
-                valid_areas="Green zones and student areas",
-                user_type="Faculty/Staff"
-            ),
-            USFPermit(
-                permit_type="E",
-                description="Evening Staff Permit",
-                annual_price=219.00,
-                semester_price=109.50,
-                valid_areas="Valid after 5:30 PM in any non-reserved space",
-                user_type="Faculty/Staff"
-            ),
-            USFPermit(
-                permit_type="R",
-                description="Reserved Permit",
-                annual_price=1603.00,
-                semester_price=801.50,
-                valid_areas="Reserved spaces and all non-reserved areas",
-                user_type="Faculty/Staff"
-            ),
-            
-            # Other permits
-            USFPermit(
-                permit_type="DV",
-                description="Daily Visitor Permit",
-                annual_price=5.00,
-                semester_price=None,
-                valid_areas="Visitor areas and student areas",
-                user_type="Visitor"
-            ),
-            USFPermit(
-                permit_type="MC",
-                description="Motorcycle Permit",
-                annual_price=219.00,
-                semester_price=109.50,
-                valid_areas="Motorcycle spaces only",
-                user_type="Any"
-            )
-        ]
-        
-        session.add_all(permits)
-        session.commit()
-        
+
+        # One multi-row INSERT instead of a tracked ORM object per permit
+        with engine.begin() as conn:
+            conn.execute(USFPermit.__table__.insert(), _USF_PERMIT_ROWS)
+
     except Exception as e:
         session.rollback()
         print(f"Error seeding USF permits: {e}")
@@ -517,68 +647,19 @@ def seed_database():
         if existing_lots > 0:
             return
         
-        # Create USF parking lots
-        collins_garage = ParkingLot(
-            name="Collins Garage",
-            total_spaces=1800,
-            latitude=28.0587,
-            longitude=-82.4139
-        )
-        session.add(collins_garage)
-        
-        beard_garage = ParkingLot(
-            name="Beard Garage",
-            total_spaces=1500,
-            latitude=28.0650,
-            longitude=-82.4144
-        )
-        session.add(beard_garage)
-        
-        laurel_garage = ParkingLot(
-            name="Laurel Garage",
-            total_spaces=1700,
-            latitude=28.0622,
-            longitude=-82.4099
-        )
-        session.add(laurel_garage)
-        
-        crescent_garage = ParkingLot(
-            name="Crescent Hill Garage",
-            total_spaces=1600,
-            latitude=28.0643,
-            longitude=-82.4119
-        )
-        session.add(crescent_garage)
-        
-        session.flush()  # To get the IDs
-        
-        # Create parking areas (by permit type)
-        areas = [
-            # Collins Garage areas
-            ParkingArea(name="Gold Zone", total_spaces=200, lot_id=collins_garage.id, permit_type="Gold"),
-            ParkingArea(name="Green Zone", total_spaces=900, lot_id=collins_garage.id, permit_type="GZ"),
-            ParkingArea(name="Resident Zone", total_spaces=500, lot_id=collins_garage.id, permit_type="S"),
-            ParkingArea(name="Non-Resident Zone", total_spaces=200, lot_id=collins_garage.id, permit_type="D"),
-            
-            # Beard Garage areas
-            ParkingArea(name="Staff Zone", total_spaces=400, lot_id=beard_garage.id, permit_type="GZ"),
-            ParkingArea(name="Student Zone", total_spaces=800, lot_id=beard_garage.id, permit_type="D"),
-            ParkingArea(name="Visitor Zone", total_spaces=200, lot_id=beard_garage.id, permit_type="DV"),
-            ParkingArea(name="Reserved Zone", total_spaces=100, lot_id=beard_garage.id, permit_type="R"),
-            
-            # Laurel Garage areas
-            ParkingArea(name="Gold Zone", total_spaces=300, lot_id=laurel_garage.id, permit_type="Gold"),
-            ParkingArea(name="Green Zone", total_spaces=1000, lot_id=laurel_garage.id, permit_type="GZ"),
-            ParkingArea(name="Visitor Zone", total_spaces=400, lot_id=laurel_garage.id, permit_type="DV"),
-            
-            # Crescent Hill Garage areas
-            ParkingArea(name="Staff Zone", total_spaces=500, lot_id=crescent_garage.id, permit_type="GZ"),
-            ParkingArea(name="Student Zone", total_spaces=900, lot_id=crescent_garage.id, permit_type="S"),
-            ParkingArea(name="Visitor Zone", total_spaces=200, lot_id=crescent_garage.id, permit_type="DV")
-        ]
-        session.add_all(areas)
-        session.commit()
-        
+        # Create USF parking lots and areas with one multi-row INSERT per
+        # table, reading the assigned lot ids back in a single query
+        with engine.begin() as conn:
+            conn.execute(ParkingLot.__table__.insert(), _SEED_LOT_ROWS)
+            lot_ids = dict(conn.execute(select(ParkingLot.name, ParkingLot.id)).all())
+            conn.execute(ParkingArea.__table__.insert(), [
+                {**area_row, 'lot_id': lot_ids[lot_name]}
+                for lot_name, area_row in _SEED_AREA_ROWS
+            ])
+
+        lots = session.query(ParkingLot).all()
+        areas = session.query(ParkingArea).all()
+
         # Generate historical data
         from data_generator import generate_parking_data
         
@@ -587,80 +668,61 @@ def seed_database():
         start_time = end_time - timedelta(days=7)
         historical_data = generate_parking_data(start_time, end_time)
         
-        # Add historical data to database
-        areas_dict = {area.name: area for area in areas}
-        
-        # Get all parking lots
-        lots = [collins_garage, beard_garage, laurel_garage, crescent_garage]
-        
-        for _, row in historical_data.iterrows():
-            # Process each lot with its areas
-            for lot in lots:
-                # Get areas for this lot
-                lot_areas = [area for area in areas if area.lot_id == lot.id]
-                
-                # Calculate total capacity for this lot
-                total_capacity = sum(area.total_spaces for area in lot_areas)
-                
-                # Calculate occupancy rate (adjust by time of day, day of week)
-                # Simulate busier hours during weekdays, especially morning and afternoon
-                base_rate = 0.4  # Base occupancy rate
-                
-                # Higher traffic during day hours on weekdays
-                if 0 <= row['day_of_week'] <= 4:  # Weekday
-                    if 8 <= row['hour'] <= 15:  # Morning to afternoon classes
-                        base_rate = 0.75
-                    elif 16 <= row['hour'] <= 18:  # Evening classes
-                        base_rate = 0.60
-                else:  # Weekend
-                    base_rate = 0.25
-                    
-                # Random variation
-                import random
-                variation = random.uniform(-0.1, 0.1)
-                occupancy_rate = min(0.95, max(0.1, base_rate + variation))
-                
-                # Calculate occupancy for this lot
-                lot_occupancy = int(lot.total_spaces * occupancy_rate)
-                
-                # Create record for the lot
-                lot_record = OccupancyRecord(
-                    timestamp=row['timestamp'],
-                    occupied_spaces=lot_occupancy,
-                    lot_id=lot.id,
-                    day_of_week=row['day_of_week'],
-                    hour=row['hour'],
-                    minute=row['minute']
+        # Build all seed records vectorized and insert them in bulk instead
+        # of constructing one tracked ORM object per row
+        rng = _rng
+        timestamps = historical_data['timestamp'].dt.to_pydatetime()
+        dow = historical_data['day_of_week'].to_numpy()
+        hour = historical_data['hour'].to_numpy()
+        n = len(historical_data)
+
+        # Occupancy rate per timestep (adjust by time of day, day of week):
+        # busier during day hours on weekdays, quiet on weekends
+        base_rate = np.full(n, 0.4)
+        weekday = dow <= 4
+        base_rate[weekday & (hour >= 8) & (hour <= 15)] = 0.75  # Morning to afternoon classes
+        base_rate[weekday & (hour >= 16) & (hour <= 18)] = 0.60  # Evening classes
+        base_rate[~weekday] = 0.25
+
+        # Group areas by lot
+        areas_by_lot = {}
+        for area in areas:
+            areas_by_lot.setdefault(area.lot_id, []).append(area)
+
+        records = []
+        for lot in lots:
+            lot_areas = areas_by_lot[lot.id]
+            total_capacity = sum(area.total_spaces for area in lot_areas)
+
+            # Random variation per timestep
+            variation = rng.uniform(-0.1, 0.1, n)
+            occupancy_rate = np.clip(base_rate + variation, 0.1, 0.95)
+            lot_occupancy = (lot.total_spaces * occupancy_rate).astype(int)
+
+            # Records for each area, distributed proportionally to area size;
+            # the last area gets any remaining spots so totals match
+            remaining_occupancy = lot_occupancy.copy()
+            for i, area in enumerate(lot_areas):
+                if i == len(lot_areas) - 1:
+                    area_occupancy = remaining_occupancy
+                else:
+                    area_ratio = area.total_spaces / total_capacity
+                    area_occupancy = (lot_occupancy * area_ratio).astype(int)
+                    remaining_occupancy = remaining_occupancy - area_occupancy
+
+                # Ensure we don't exceed the area's capacity
+                area_occupancy = np.minimum(area_occupancy, area.total_spaces)
+
+                records.extend(
+                    {'timestamp': t, 'occupied_spaces': int(occ), 'lot_id': lot.id, 'area_id': area.id}
+                    for t, occ in zip(timestamps, area_occupancy)
                 )
-                session.add(lot_record)
-                
-                # Create records for each area in this lot
-                remaining_occupancy = lot_occupancy
-                for i, area in enumerate(lot_areas):
-                    # Last area gets any remaining spots to ensure total matches
-                    if i == len(lot_areas) - 1:
-                        area_occupancy = remaining_occupancy
-                    else:
-                        # Distribute proportionally to area size
-                        area_ratio = area.total_spaces / total_capacity
-                        area_occupancy = int(lot_occupancy * area_ratio)
-                        remaining_occupancy -= area_occupancy
-                    
-                    # Ensure we don't exceed the area's capacity
-                    area_occupancy = min(area_occupancy, area.total_spaces)
-                    
-                    area_record = OccupancyRecord(
-                        timestamp=row['timestamp'],
-                        occupied_spaces=area_occupancy,
-                        lot_id=lot.id,
-                        area_id=area.id,
-                        day_of_week=row['day_of_week'],
-                        hour=row['hour'],
-                        minute=row['minute']
-                    )
-                    session.add(area_record)
-        
-        session.commit()
+
+        # Core executemany skips ORM mapping overhead entirely for the seed;
+        # batches of 10k rows cap per-statement memory as the history grows
+        with engine.begin() as conn:
+            for start in range(0, len(records), 10000):
+                conn.execute(OccupancyRecord.__table__.insert(), records[start:start + 10000])
     except Exception as e:
         session.rollback()
         print(f"Error seeding database: {e}")
@@ -1,31 +1,37 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
 import base64
 
+# Fallback icon when an SVG file can't be loaded
+_DEFAULT_SVG = """
+<svg width="50" height="50" xmlns="http://www.w3.org/2000/svg">
+    <rect width="50" height="50" style="fill:blue;stroke-width:3;stroke:rgb(0,0,0)" />
+    <text x="25" y="25" font-family="Arial" font-size="20" text-anchor="middle" fill="white">P</text>
+</svg>
+"""
+
+@lru_cache(maxsize=32)
 def load_svg(svg_file):
     """
     Load an SVG file and return it as HTML for display in Streamlit.
-    
+
+    The result is cached per path, so repeated Streamlit reruns skip the
+    file read entirely.
+
     Parameters:
     - svg_file: Path to the SVG file
-    
+
     Returns:
     - HTML string with the SVG content
     """
     try:
         with open(svg_file, 'r') as f:
-            svg_content = f.read()
-            return svg_content
-    except Exception as e:
+            return f.read()
+    except Exception:
         # If file can't be loaded, return a simple SVG
-        default_svg = """
-        <svg width="50" height="50" xmlns="http://www.w3.org/2000/svg">
-            <rect width="50" height="50" style="fill:blue;stroke-width:3;stroke:rgb(0,0,0)" />
-            <text x="25" y="25" font-family="Arial" font-size="20" text-anchor="middle" fill="white">P</text>
-        </svg>
-        """
-        return default_svg
+        return _DEFAULT_SVG
 
 def calculate_statistics(historical_data):
     """
@@ -37,13 +43,18 @@ def calculate_statistics(historical_data):
     Returns:
     - Dictionary with calculated statistics
     """
+    # Timestamps are stored sorted, so the day filters reduce to binary
+    # searches for slice bounds instead of boolean scans over every row
+    ts = historical_data['timestamp'].to_numpy()
+    today = np.datetime64(datetime.now().date())
+
     # Get today's data
-    today = datetime.now().date()
-    today_data = historical_data[historical_data['timestamp'].dt.date == today]
-    
+    lo, hi = np.searchsorted(ts, [today, today + np.timedelta64(1, 'D')])
+    today_data = historical_data.iloc[lo:hi]
+
     # Get last 7 days data
-    last_week = today - timedelta(days=7)
-    last_week_data = historical_data[historical_data['timestamp'].dt.date >= last_week]
+    last_week = today - np.timedelta64(7, 'D')
+    last_week_data = historical_data.iloc[np.searchsorted(ts, last_week):]
     
     # Calculate statistics
     stats = {}
@@ -88,16 +99,31 @@ def calculate_statistics(historical_data):
     
     # Calculate busy times
     if len(last_week_data) > 0:
-        # Group by hour and calculate average occupancy
-        hourly_avg = last_week_data.groupby('hour')['occupancy'].mean()
-        stats['busiest_hour'] = hourly_avg.idxmax()
-        stats['quietest_hour'] = hourly_avg.idxmin()
-        
-        # Group by day of week and calculate average occupancy
-        daily_avg = last_week_data.groupby('day_of_week')['occupancy'].mean()
-        stats['busiest_day'] = daily_avg.idxmax()
-        stats['quietest_day'] = daily_avg.idxmin()
-        
+        # One pass over the week: scatter occupancy into dense day*24+hour
+        # buckets, then marginalize the sums and counts. This replaces two
+        # independent groupby scans (and their hash tables) with direct
+        # indexing into 168-element arrays.
+        key = (last_week_data['day_of_week'].to_numpy(np.int64) * 24
+               + last_week_data['hour'].to_numpy(np.int64))
+        occ = last_week_data['occupancy'].to_numpy(np.float64)
+        sums = np.zeros(7 * 24)
+        counts = np.zeros(7 * 24)
+        np.add.at(sums, key, occ)
+        np.add.at(counts, key, 1)
+        sum_mat = sums.reshape(7, 24)
+        cnt_mat = counts.reshape(7, 24)
+
+        # Hour/day marginals match groupby('hour')/groupby('day_of_week')
+        # means exactly because both weight by row counts
+        with np.errstate(invalid='ignore'):
+            hourly_avg = sum_mat.sum(axis=0) / cnt_mat.sum(axis=0)
+            daily_avg = sum_mat.sum(axis=1) / cnt_mat.sum(axis=1)
+
+        stats['busiest_hour'] = int(np.nanargmax(hourly_avg))
+        stats['quietest_hour'] = int(np.nanargmin(hourly_avg))
+        stats['busiest_day'] = int(np.nanargmax(daily_avg))
+        stats['quietest_day'] = int(np.nanargmin(daily_avg))
+
         # Convert day of week to day name
         day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         stats['busiest_day_name'] = day_names[stats['busiest_day']]
@@ -112,62 +138,88 @@ def calculate_statistics(historical_data):
     
     return stats
 
+# Threshold lookup tables for recommendations: searchsorted picks the bucket,
+# so the scalar and batch paths share one branchless implementation
+_STATUS_BOUNDS = np.array([50.0, 80.0])
+_STATUS_TEXT = np.array([
+    "Low occupancy - Plenty of parking available",
+    "Moderate occupancy - Parking available but filling up",
+    "High occupancy - Limited parking available"
+], dtype=object)
+_STATUS_COLOR = np.array(["green", "orange", "red"], dtype=object)
+
+_TREND_TEXT = np.array([
+    "Occupancy decreasing significantly",
+    "Occupancy decreasing",
+    "Occupancy stable",
+    "Occupancy increasing",
+    "Occupancy increasing significantly"
+], dtype=object)
+_TREND_ICON = np.array(["↓↓", "↓", "→", "↑", "↑↑"], dtype=object)
+
+_REC_BOUNDS = np.array([50.0, 75.0, 90.0])
+_REC_TEXT = np.array([
+    "Good parking availability expected. No special measures needed.",
+    "Moderate parking availability expected. Some searching may be required.",
+    "Parking may be difficult to find during peak hours. Plan accordingly.",
+    "Parking will be very limited. Consider alternative transportation or arriving early."
+], dtype=object)
+
+def generate_recommendations_batch(current_occupancy, predicted_occupancy, total_spaces):
+    """
+    Generate parking recommendations for arrays of areas in one pass.
+
+    Parameters:
+    - current_occupancy: Array-like of currently occupied parking spaces
+    - predicted_occupancy: Array-like of predicted occupied parking spaces
+    - total_spaces: Total spaces per area (scalar or array-like)
+
+    Returns:
+    - Dictionary with object arrays: current_status, current_color, trend,
+      trend_icon, recommendation
+    """
+    total = np.asarray(total_spaces, dtype=np.float64)
+    current_pct = np.asarray(current_occupancy, dtype=np.float64) / total * 100
+    predicted_pct = np.asarray(predicted_occupancy, dtype=np.float64) / total * 100
+
+    status_idx = np.searchsorted(_STATUS_BOUNDS, current_pct, side='right')
+    # The trend buckets mix closures ([-10, -5) decreasing, [-5, 5] stable,
+    # (5, 10] increasing), which no single searchsorted side reproduces, so
+    # mirror the original comparisons directly
+    diff = predicted_pct - current_pct
+    trend_idx = np.select(
+        [diff < -10, diff < -5, diff <= 5, diff <= 10],
+        [0, 1, 2, 3],
+        default=4
+    )
+    rec_idx = np.searchsorted(_REC_BOUNDS, predicted_pct, side='right')
+
+    return {
+        'current_status': _STATUS_TEXT[status_idx],
+        'current_color': _STATUS_COLOR[status_idx],
+        'trend': _TREND_TEXT[trend_idx],
+        'trend_icon': _TREND_ICON[trend_idx],
+        'recommendation': _REC_TEXT[rec_idx]
+    }
+
 def generate_recommendations(current_occupancy, predicted_occupancy, total_spaces):
     """
     Generate parking recommendations based on current and predicted occupancy.
-    
+
     Parameters:
     - current_occupancy: Current number of occupied parking spaces
     - predicted_occupancy: Predicted number of occupied parking spaces
     - total_spaces: Total number of parking spaces
-    
+
     Returns:
     - Dictionary with recommendations
     """
-    current_pct = (current_occupancy / total_spaces) * 100
-    predicted_pct = (predicted_occupancy / total_spaces) * 100
-    
-    recommendations = {}
-    
-    # Determine current status
-    if current_pct < 50:
-        recommendations['current_status'] = "Low occupancy - Plenty of parking available"
-        recommendations['current_color'] = "green"
-    elif current_pct < 80:
-        recommendations['current_status'] = "Moderate occupancy - Parking available but filling up"
-        recommendations['current_color'] = "orange"
-    else:
-        recommendations['current_status'] = "High occupancy - Limited parking available"
-        recommendations['current_color'] = "red"
-    
-    # Determine trend
-    if predicted_pct - current_pct > 10:
-        recommendations['trend'] = "Occupancy increasing significantly"
-        recommendations['trend_icon'] = "↑↑"
-    elif predicted_pct - current_pct > 5:
-        recommendations['trend'] = "Occupancy increasing"
-        recommendations['trend_icon'] = "↑"
-    elif predicted_pct - current_pct < -10:
-        recommendations['trend'] = "Occupancy decreasing significantly"
-        recommendations['trend_icon'] = "↓↓"
-    elif predicted_pct - current_pct < -5:
-        recommendations['trend'] = "Occupancy decreasing"
-        recommendations['trend_icon'] = "↓"
-    else:
-        recommendations['trend'] = "Occupancy stable"
-        recommendations['trend_icon'] = "→"
-    
-    # Generate recommendation
-    if predicted_pct >= 90:
-        recommendations['recommendation'] = "Parking will be very limited. Consider alternative transportation or arriving early."
-    elif predicted_pct >= 75:
-        recommendations['recommendation'] = "Parking may be difficult to find during peak hours. Plan accordingly."
-    elif predicted_pct >= 50:
-        recommendations['recommendation'] = "Moderate parking availability expected. Some searching may be required."
-    else:
-        recommendations['recommendation'] = "Good parking availability expected. No special measures needed."
-    
-    return recommendations
+    batch = generate_recommendations_batch(
+        np.array([current_occupancy]),
+        np.array([predicted_occupancy]),
+        total_spaces
+    )
+    return {key: value[0] for key, value in batch.items()}
 
 if __name__ == "__main__":
     # Test SVG loading